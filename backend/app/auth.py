@@ -3,24 +3,26 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import hmac
-import json
 import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from urllib.parse import urlencode, urlparse, urlunparse
 
+import orjson
 import requests
 from fastapi import HTTPException, Request
 from fastapi.responses import RedirectResponse, Response
 
 from . import config
-from .db import public_row, public_rows
+from .db import public_rows
 
 
 DISCORD_AUTHORIZE_URL = "https://discord.com/oauth2/authorize"
 DISCORD_TOKEN_URL = "https://discord.com/api/oauth2/token"
 DISCORD_ME_URL = "https://discord.com/api/users/@me"
 
+_HTTP_SESSION = requests.Session()
+
 
 def _now_utc() -> datetime:
     return datetime.utcnow()
@@ -189,7 +191,7 @@ async def list_identities(pool, user_id: int) -> list[dict[str, Any]]:
         """,
         int(user_id),
     )
-    return public_rows([dict(row) for row in rows])
+    return public_rows(rows)
 
 
 async def build_session_payload(pool, user_id: int) -> dict[str, Any]:
@@ -200,7 +202,7 @@ async def build_session_payload(pool, user_id: int) -> dict[str, Any]:
     primary_steam_id = user.get("primary_steam_id")
     return {
         "authenticated": True,
-        "user": public_row({
+        "user": {
             "user_id": user["user_id"],
             "display_name": user.get("display_name"),
             "primary_discord_id": user.get("primary_discord_id"),
@@ -210,7 +212,7 @@ async def build_session_payload(pool, user_id: int) -> dict[str, Any]:
             "updated_at": user.get("updated_at"),
             "last_login_at": user.get("last_login_at"),
             "identities": identities,
-        }),
+        },
     }
 
 
@@ -391,7 +393,7 @@ async def upsert_identity(
         provider_subject,
         display_name,
         avatar_url,
-        json.dumps(profile_json or {}),
+        orjson.dumps(profile_json or {}).decode(),
         bool(make_primary),
     )
     await pool.execute(
@@ -542,15 +544,15 @@ async def unlink_identity(pool, *, user_id: int, provider: str, provider_subject
 
 
 def _http_post_json(url: str, *, data: dict[str, Any], headers: dict[str, str] | None = None) -> dict[str, Any]:
-    response = requests.post(url, data=data, headers=headers or {}, timeout=20)
+    response = _HTTP_SESSION.post(url, data=data, headers=headers or {}, timeout=20)
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
 
 
 def _http_get_json(url: str, *, headers: dict[str, str] | None = None) -> dict[str, Any]:
-    response = requests.get(url, headers=headers or {}, timeout=20)
+    response = _HTTP_SESSION.get(url, headers=headers or {}, timeout=20)
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
 
 
 async def exchange_discord_code(code: str, redirect_uri: str) -> dict[str, Any]:
@@ -625,9 +627,9 @@ def build_steam_authorize_url(request: Request, *, intent: str) -> str:
 def _verify_steam_openid(url: str, data: dict[str, Any]) -> str:
     verify_payload = {key: value for key, value in data.items() if key.startswith("openid.")}
     verify_payload["openid.mode"] = "check_authentication"
-    response = requests.post(url, data=verify_payload, timeout=20)
+    response = _HTTP_SESSION.post(url, data=verify_payload, timeout=20)
     response.raise_for_status()
-    if "is_valid:true" not in response.text:
+    if b"is_valid:true" not in response.content:
         raise HTTPException(status_code=400, detail="Steam OpenID verification failed.")
     claimed_id = str(data.get("openid.claimed_id") or "").strip()
     steam_id = claimed_id.rsplit("/", 1)[-1]
@@ -684,7 +686,7 @@ async def create_link_challenge(
         provider_subject,
         display_name,
         avatar_url,
-        json.dumps(profile_json or {}),
+        orjson.dumps(profile_json or {}).decode(),
         target_discord_id,
         _token_digest(token),
         token,
@@ -1,17 +1,32 @@
 from __future__ import annotations
 
-import json
 import time
 from typing import Any
 
+import orjson
+
 from . import config
+from .db import json_default
 
 try:
     from redis.asyncio import Redis
 except ImportError:  # pragma: no cover - optional dependency
     Redis = None  # type: ignore[assignment]
 
-_LOCAL_CACHE: dict[str, tuple[float, str]] = {}
+_LOCAL_CACHE_MAX_ENTRIES = 2048
+_LOCAL_CACHE: dict[str, tuple[float, bytes]] = {}
+_LOCAL_RESPONSE_CACHE_MAX_ENTRIES = 256
+_LOCAL_RESPONSE_CACHE: dict[str, tuple[float, bytes, str]] = {}
+
+
+def _make_room(entries: dict[str, tuple], key: str, now: float, max_entries: int) -> None:
+    entries.pop(key, None)
+    if len(entries) < max_entries:
+        return
+    for expired_key in [cached_key for cached_key, cached in entries.items() if cached[0] < now]:
+        entries.pop(expired_key, None)
+    while len(entries) >= max_entries:
+        entries.pop(next(iter(entries)))
 
 
 async def create_redis_client() -> Redis | None:
@@ -37,24 +52,45 @@ async def get_json(client: Redis | None, key: str) -> Any | None:
         if expires_at < time.monotonic():
             _LOCAL_CACHE.pop(key, None)
             return None
-        return json.loads(payload)
+        return orjson.loads(payload)
     try:
         payload = await client.get(key)
     except Exception:  # pragma: no cover - cache should fail open
         return None
     if payload is None:
         return None
-    return json.loads(payload)
+    return orjson.loads(payload)
 
 
 async def set_json(client: Redis | None, key: str, value: Any, ttl_seconds: int) -> None:
     if ttl_seconds <= 0:
         return
-    payload = json.dumps(value)
+    payload = orjson.dumps(value, default=json_default)
     if client is None:
-        _LOCAL_CACHE[key] = (time.monotonic() + ttl_seconds, payload)
+        now = time.monotonic()
+        _make_room(_LOCAL_CACHE, key, now, _LOCAL_CACHE_MAX_ENTRIES)
+        _LOCAL_CACHE[key] = (now + ttl_seconds, payload)
         return
     try:
         await client.set(key, payload, ex=ttl_seconds)
     except Exception:  # pragma: no cover - cache should fail open
         return
+
+
+def get_local_response(key: str) -> tuple[bytes, str] | None:
+    cached = _LOCAL_RESPONSE_CACHE.get(key)
+    if cached is None:
+        return None
+    expires_at, body, etag = cached
+    if expires_at < time.monotonic():
+        _LOCAL_RESPONSE_CACHE.pop(key, None)
+        return None
+    return body, etag
+
+
+def set_local_response(key: str, body: bytes, etag: str, ttl_seconds: int) -> None:
+    if ttl_seconds <= 0:
+        return
+    now = time.monotonic()
+    _make_room(_LOCAL_RESPONSE_CACHE, key, now, _LOCAL_RESPONSE_CACHE_MAX_ENTRIES)
+    _LOCAL_RESPONSE_CACHE[key] = (now + ttl_seconds, body, etag)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -10,23 +11,57 @@ from dotenv import load_dotenv
 ROOT_DIR = Path(__file__).resolve().parents[3]
 BACKEND_DIR = Path(__file__).resolve().parents[1]
 
-load_dotenv(ROOT_DIR / ".env")
-load_dotenv(BACKEND_DIR / ".env")
+SKIP_DOTENV = os.getenv("HUB_SKIP_DOTENV", "").strip() == "1" or bool(os.getenv("KUBERNETES_SERVICE_HOST"))
+
+if not SKIP_DOTENV:
+    try:
+        from ._env_compiled import ENV as _COMPILED_ENV
+    except ImportError:
+        load_dotenv(ROOT_DIR / ".env")
+        load_dotenv(BACKEND_DIR / ".env")
+    else:
+        os.environ.update({key: value for key, value in _COMPILED_ENV.items() if key not in os.environ})
 
 
 def _env(name: str, default: str = "") -> str:
     return str(os.getenv(name, default)).strip()
 
 
+TRUTHY_VALUES = frozenset(("1", "true", "yes", "on"))
+
+
 def _env_bool(name: str, default: bool = False) -> bool:
-    return _env(name, "1" if default else "0").lower() in {"1", "true", "yes", "on"}
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return raw in TRUTHY_VALUES or raw.strip().lower() in TRUTHY_VALUES
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = _env(name)
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        raise RuntimeError(f"{name} must be an integer, got {raw!r}") from None
+
 
+def _env_float(name: str, default: float) -> float:
+    raw = _env(name)
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        raise RuntimeError(f"{name} must be a number, got {raw!r}") from None
 
-def _env_list(name: str, default: str = "") -> list[str]:
+
+def _env_list(name: str, default: str = "") -> tuple[str, ...]:
     raw = _env(name, default)
     if not raw:
-        return []
-    return [item.strip() for item in raw.split(",") if item.strip()]
+        return ()
+    return tuple(item.strip() for item in raw.split(",") if item.strip())
 
 
 def _schema_ident(name: str, default: str) -> str:
@@ -36,6 +71,7 @@ def _schema_ident(name: str, default: str) -> str:
     return value
 
 
+@lru_cache(maxsize=1)
 def postgres_dsn() -> str:
     dsn = _env("SUPABASE_DB_URL") or _env("SUPABASE_POOLER_URL")
     if not dsn:
@@ -45,15 +81,28 @@ def postgres_dsn() -> str:
 
 API_TITLE = _env("IOSCA_HUB_API_TITLE", "IOSCA Hub API")
 API_VERSION = _env("IOSCA_HUB_API_VERSION", "0.1.0")
-POSTGRES_POOL_MIN_SIZE = int(_env("HUB_POSTGRES_POOL_MIN_SIZE", "1"))
-POSTGRES_POOL_MAX_SIZE = int(_env("HUB_POSTGRES_POOL_MAX_SIZE", "5"))
+POSTGRES_POOL_MIN_SIZE = max(1, _env_int("HUB_POSTGRES_POOL_MIN_SIZE", 2))
+POSTGRES_POOL_MAX_SIZE = max(POSTGRES_POOL_MIN_SIZE, _env_int("HUB_POSTGRES_POOL_MAX_SIZE", 10))
+POSTGRES_POOL_MAX_INACTIVE_LIFETIME_SECONDS = _env_float("HUB_POSTGRES_POOL_MAX_INACTIVE_LIFETIME_SECONDS", 300.0)
+POSTGRES_POOL_MAX_QUERIES = _env_int("HUB_POSTGRES_POOL_MAX_QUERIES", 50000)
+POSTGRES_COMMAND_TIMEOUT_SECONDS = _env_float("HUB_POSTGRES_COMMAND_TIMEOUT_SECONDS", 120.0)
+POSTGRES_APPLICATION_NAME = _env("HUB_POSTGRES_APPLICATION_NAME", "iosca-hub")
+POSTGRES_CONNECT_TIMEOUT_SECONDS = _env_float("HUB_POSTGRES_CONNECT_TIMEOUT_SECONDS", 10.0)
+POSTGRES_PGBOUNCER_MODE = _env_bool(
+    "HUB_POSTGRES_PGBOUNCER_MODE",
+    not _env("SUPABASE_DB_URL") and bool(_env("SUPABASE_POOLER_URL")),
+)
+POSTGRES_STATEMENT_CACHE_SIZE = _env_int("HUB_POSTGRES_STATEMENT_CACHE_SIZE", 1024)
+POSTGRES_MAX_CACHEABLE_STATEMENT_SIZE = _env_int("HUB_POSTGRES_MAX_CACHEABLE_STATEMENT_SIZE", 15360)
+POSTGRES_MAX_CACHED_STATEMENT_LIFETIME_SECONDS = _env_int("HUB_POSTGRES_MAX_CACHED_STATEMENT_LIFETIME_SECONDS", 0)
 HUB_POSTGRES_SCHEMA = _schema_ident("HUB_POSTGRES_SCHEMA", "iosca_hub_production")
-HUB_DB_QUERY_TIMEOUT_SECONDS = int(_env("HUB_DB_QUERY_TIMEOUT_SECONDS", "15"))
+HUB_DB_QUERY_TIMEOUT_SECONDS = _env_int("HUB_DB_QUERY_TIMEOUT_SECONDS", 15)
 REDIS_URL = _env("HUB_REDIS_URL") or _env("REDIS_URL") or _env("UPSTASH_REDIS_URL")
 REDIS_KEY_PREFIX = _env("HUB_REDIS_KEY_PREFIX", "iosca-hub")
-API_CACHE_TTL_SECONDS = int(_env("HUB_API_CACHE_TTL_SECONDS", "60"))
-SUMMARY_CACHE_TTL_SECONDS = int(_env("HUB_SUMMARY_CACHE_TTL_SECONDS", "120"))
-BOOTSTRAP_CACHE_TTL_SECONDS = int(_env("HUB_BOOTSTRAP_CACHE_TTL_SECONDS", "180"))
+API_CACHE_TTL_SECONDS = _env_int("HUB_API_CACHE_TTL_SECONDS", 60)
+SUMMARY_CACHE_TTL_SECONDS = _env_int("HUB_SUMMARY_CACHE_TTL_SECONDS", 30)
+LIST_CACHE_TTL_SECONDS = _env_int("HUB_LIST_CACHE_TTL_SECONDS", 15)
+BOOTSTRAP_CACHE_TTL_SECONDS = _env_int("HUB_BOOTSTRAP_CACHE_TTL_SECONDS", 180)
 HUB_LIVE_DATA_TIMEZONE = _env("HUB_LIVE_DATA_TIMEZONE", _env("MAIN_GUILD_TIMEZONE", "America/New_York"))
 HUB_CORS_ORIGINS = _env_list(
     "HUB_CORS_ORIGINS",
@@ -65,10 +114,11 @@ HUB_SESSION_COOKIE_NAME = _env("HUB_SESSION_COOKIE_NAME", "iosca_hub_session")
 HUB_SESSION_COOKIE_DOMAIN = _env("HUB_SESSION_COOKIE_DOMAIN")
 HUB_SESSION_COOKIE_SECURE = _env_bool("HUB_SESSION_COOKIE_SECURE", True)
 HUB_SESSION_COOKIE_SAMESITE = _env("HUB_SESSION_COOKIE_SAMESITE", "none").lower() or "none"
-HUB_SESSION_TTL_SECONDS = int(_env("HUB_SESSION_TTL_SECONDS", "2592000"))
+HUB_SESSION_TTL_SECONDS = _env_int("HUB_SESSION_TTL_SECONDS", 2592000)
 HUB_DISCORD_CLIENT_ID = _env("HUB_DISCORD_CLIENT_ID")
 HUB_DISCORD_CLIENT_SECRET = _env("HUB_DISCORD_CLIENT_SECRET")
 HUB_DISCORD_SCOPE = _env("HUB_DISCORD_SCOPE", "identify")
 HUB_STEAM_OPENID_URL = _env("HUB_STEAM_OPENID_URL", "https://steamcommunity.com/openid/login")
-HUB_AUTH_CHALLENGE_TTL_SECONDS = int(_env("HUB_AUTH_CHALLENGE_TTL_SECONDS", "900"))
-HUB_LIVE_SYNC_POLL_SECONDS = max(2, int(_env("HUB_LIVE_SYNC_POLL_SECONDS", "5")))
+HUB_AUTH_CHALLENGE_TTL_SECONDS = _env_int("HUB_AUTH_CHALLENGE_TTL_SECONDS", 900)
+HUB_LIVE_SYNC_POLL_SECONDS = max(2, _env_int("HUB_LIVE_SYNC_POLL_SECONDS", 5))
+HUB_LIVE_SEND_TIMEOUT_SECONDS = _env_float("HUB_LIVE_SEND_TIMEOUT_SECONDS", 5.0)
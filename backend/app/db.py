@@ -1,25 +1,91 @@
 from __future__ import annotations
 
+import socket
 from datetime import date, datetime
 from decimal import Decimal
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 import asyncpg
+import orjson
 
 from . import config
 
 
-async def _create_pool(*, search_path: str | None = None) -> asyncpg.Pool:
+JS_MAX_SAFE_INTEGER = 2**53 - 1
+
+TCP_KEEPALIVE_OPTIONS = (
+    ("TCP_KEEPIDLE", 60),
+    ("TCP_KEEPINTVL", 30),
+    ("TCP_KEEPCNT", 3),
+)
+
+
+def _enable_tcp_keepalive(conn: asyncpg.Connection) -> None:
+    transport = getattr(conn, "_transport", None)
+    sock = transport.get_extra_info("socket") if transport is not None else None
+    if sock is None or sock.family not in (socket.AF_INET, socket.AF_INET6):
+        return
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    for option_name, value in TCP_KEEPALIVE_OPTIONS:
+        option = getattr(socket, option_name, None)
+        if option is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, option, value)
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    if isinstance(value, str):
+        return b"\x01" + value.encode()
+    return b"\x01" + orjson.dumps(value, default=json_default)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    return orjson.loads(data[1:])
+
+
+async def _create_pool(
+    *,
+    search_path: str | None = None,
+    jsonb_codec: bool = False,
+    numeric_as_float: bool = False,
+) -> asyncpg.Pool:
     async def init_connection(conn: asyncpg.Connection) -> None:
+        _enable_tcp_keepalive(conn)
+        if jsonb_codec:
+            await conn.set_type_codec(
+                "jsonb",
+                schema="pg_catalog",
+                encoder=_encode_jsonb,
+                decoder=_decode_jsonb,
+                format="binary",
+            )
+        if numeric_as_float:
+            await conn.set_type_codec(
+                "numeric",
+                schema="pg_catalog",
+                encoder=str,
+                decoder=float,
+                format="text",
+            )
+
+    server_settings = {"application_name": config.POSTGRES_APPLICATION_NAME}
+    if not config.POSTGRES_PGBOUNCER_MODE:
+        server_settings["jit"] = "off"
         if search_path:
-            await conn.execute(f"SET search_path TO {search_path}")
+            server_settings["search_path"] = search_path
 
     return await asyncpg.create_pool(
         config.postgres_dsn(),
         min_size=config.POSTGRES_POOL_MIN_SIZE,
         max_size=config.POSTGRES_POOL_MAX_SIZE,
-        command_timeout=120,
-        statement_cache_size=0,
+        max_inactive_connection_lifetime=config.POSTGRES_POOL_MAX_INACTIVE_LIFETIME_SECONDS,
+        max_queries=config.POSTGRES_POOL_MAX_QUERIES,
+        timeout=config.POSTGRES_CONNECT_TIMEOUT_SECONDS,
+        command_timeout=config.POSTGRES_COMMAND_TIMEOUT_SECONDS,
+        statement_cache_size=0 if config.POSTGRES_PGBOUNCER_MODE else config.POSTGRES_STATEMENT_CACHE_SIZE,
+        max_cacheable_statement_size=config.POSTGRES_MAX_CACHEABLE_STATEMENT_SIZE,
+        max_cached_statement_lifetime=config.POSTGRES_MAX_CACHED_STATEMENT_LIFETIME_SECONDS,
+        server_settings=server_settings,
         init=init_connection,
     )
 
@@ -28,8 +94,37 @@ async def create_postgres_pool() -> asyncpg.Pool:
     return await _create_pool()
 
 
-async def create_hub_postgres_pool() -> asyncpg.Pool:
-    return await _create_pool(search_path=f"{config.HUB_POSTGRES_SCHEMA},public")
+async def create_hub_postgres_pool(*, jsonb_codec: bool = False, numeric_as_float: bool = False) -> asyncpg.Pool:
+    return await _create_pool(
+        search_path=f"{config.HUB_POSTGRES_SCHEMA},public",
+        jsonb_codec=jsonb_codec,
+        numeric_as_float=numeric_as_float,
+    )
+
+
+def json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return None if value.is_nan() else float(value)
+    if isinstance(value, int) and abs(value) > JS_MAX_SAFE_INTEGER:
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _safe_integers(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _safe_integers(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_safe_integers(item) for item in value]
+    if isinstance(value, int) and not isinstance(value, bool) and abs(value) > JS_MAX_SAFE_INTEGER:
+        return str(value)
+    return value
+
+
+def dumps_public(value: Any) -> bytes:
+    try:
+        return orjson.dumps(value, default=json_default, option=orjson.OPT_STRICT_INTEGER)
+    except orjson.JSONEncodeError:
+        return orjson.dumps(_safe_integers(value), default=json_default)
 
 
 def public_row(value: Any) -> Any:
@@ -44,5 +139,5 @@ def public_row(value: Any) -> Any:
     return value
 
 
-def public_rows(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    return [public_row(dict(row)) for row in rows]
+def public_rows(rows: Iterable[Mapping[str, Any]]) -> list[dict[str, Any]]:
+    return [{key: public_row(item) for key, item in row.items()} for row in rows]
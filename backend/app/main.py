@@ -2,19 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import json
 from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
 import re
 from typing import Any
 from zoneinfo import ZoneInfo
 
+import orjson
 from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse, Response
 
 from . import auth, cache, config, player_registration
-from .db import create_hub_postgres_pool, public_row, public_rows
+from .db import create_hub_postgres_pool, dumps_public, public_row, public_rows
 
 OPTIONAL_MATCH_PLAYER_STATS_COLUMNS = (
     "free_kicks",
@@ -25,30 +26,68 @@ OPTIONAL_MATCH_PLAYER_STATS_COLUMNS = (
 )
 
 
+class LiveSyncSubscriber:
+    def __init__(self, websocket: WebSocket) -> None:
+        self.websocket = websocket
+        self.pending_message: str | None = None
+        self.ready = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+    def push(self, message: str) -> None:
+        self.pending_message = message
+        self.ready.set()
+
+    async def run(self, broker: LiveSyncBroker) -> None:
+        while True:
+            await self.ready.wait()
+            self.ready.clear()
+            message, self.pending_message = self.pending_message, None
+            if message is None:
+                continue
+            try:
+                await asyncio.wait_for(
+                    self.websocket.send_text(message),
+                    timeout=config.HUB_LIVE_SEND_TIMEOUT_SECONDS,
+                )
+            except Exception:
+                broker.connections.pop(self.websocket, None)
+                try:
+                    await self.websocket.close(code=1011)
+                except Exception:
+                    pass
+                return
+
+
 class LiveSyncBroker:
     def __init__(self) -> None:
-        self.connections: set[WebSocket] = set()
-        self.last_payload: dict[str, Any] | None = None
+        self.connections: dict[WebSocket, LiveSyncSubscriber] = {}
+        self.last_message: str | None = None
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
-        self.connections.add(websocket)
-        if self.last_payload is not None:
-            await websocket.send_json(self.last_payload)
+        subscriber = LiveSyncSubscriber(websocket)
+        self.connections[websocket] = subscriber
+        if self.last_message is not None:
+            subscriber.push(self.last_message)
+        subscriber.task = asyncio.create_task(subscriber.run(self))
 
     def disconnect(self, websocket: WebSocket) -> None:
-        self.connections.discard(websocket)
+        subscriber = self.connections.pop(websocket, None)
+        if subscriber is not None and subscriber.task is not None:
+            subscriber.task.cancel()
 
     async def broadcast(self, payload: dict[str, Any]) -> None:
-        self.last_payload = payload
-        stale: list[WebSocket] = []
-        for websocket in self.connections:
-            try:
-                await websocket.send_json(payload)
-            except Exception:
-                stale.append(websocket)
-        for websocket in stale:
-            self.disconnect(websocket)
+        message = dumps_public(payload).decode()
+        self.last_message = message
+        for subscriber in list(self.connections.values()):
+            subscriber.push(message)
+
+    async def close(self) -> None:
+        tasks = [subscriber.task for subscriber in self.connections.values() if subscriber.task is not None]
+        self.connections.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
 
 async def _fetch_live_sync_payload(pool) -> dict[str, Any]:
@@ -59,9 +98,9 @@ async def _fetch_live_sync_payload(pool) -> dict[str, Any]:
         ORDER BY sync_key ASC
         """
     )
-    items = public_rows([dict(row) for row in rows])
+    items = public_rows(rows)
     fingerprint = hashlib.sha1(
-        json.dumps(items, sort_keys=True, default=str).encode("utf-8")
+        orjson.dumps(items, default=str, option=orjson.OPT_SORT_KEYS)
     ).hexdigest()
     return {
         "type": "hub_sync_state",
@@ -74,7 +113,7 @@ async def _run_live_sync_poller(app: FastAPI) -> None:
     while True:
         try:
             payload = await _fetch_live_sync_payload(app.state.hub_pool)
-            fingerprint = json.dumps(payload, sort_keys=True)
+            fingerprint = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
             if fingerprint != getattr(app.state, "live_sync_fingerprint", None):
                 app.state.live_sync_fingerprint = fingerprint
                 await app.state.live_sync_broker.broadcast(payload)
@@ -101,7 +140,7 @@ async def _fetch_table_columns(pool, table_name: str) -> set[str]:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    app.state.hub_pool = await create_hub_postgres_pool()
+    app.state.hub_pool = await create_hub_postgres_pool(jsonb_codec=True, numeric_as_float=True)
     app.state.redis = await cache.create_redis_client()
     app.state.hub_match_player_stats_columns = await _fetch_table_columns(
         app.state.hub_pool,
@@ -118,15 +157,21 @@ async def lifespan(app: FastAPI):
             await app.state.live_sync_task
         except asyncio.CancelledError:
             pass
+        await app.state.live_sync_broker.close()
         await cache.close_redis_client(getattr(app.state, "redis", None))
         await app.state.hub_pool.close()
 
 
-app = FastAPI(title=config.API_TITLE, version=config.API_VERSION, lifespan=lifespan)
+app = FastAPI(
+    title=config.API_TITLE,
+    version=config.API_VERSION,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=config.HUB_CORS_ORIGINS or ["http://localhost:5173"],
+    allow_origins=config.HUB_CORS_ORIGINS or ("http://localhost:5173",),
     allow_credentials=True,
     allow_methods=["GET", "POST", "OPTIONS"],
     allow_headers=["*"],
@@ -210,89 +255,11 @@ def build_player_stats_subquery(existing_columns: set[str] | None = None) -> str
     GROUP BY pmd.steam_id
 """
 
-CURRENT_PLAYER_TEAM_SUBQUERY = """
-    SELECT
-        latest.steam_id,
-        latest.resolved_team_guild_id AS team_guild_id,
-        latest.resolved_team_name AS guild_team_name
-    FROM (
-        SELECT
-            pmd.steam_id,
-            COALESCE(
-                NULLIF(pmd.team_guild_id, ''),
-                CASE
-                    WHEN pmd.team_side = 'home' THEN m.home_guild_id
-                    WHEN pmd.team_side = 'away' THEN m.away_guild_id
-                    ELSE NULL
-                END
-            ) AS resolved_team_guild_id,
-            COALESCE(
-                NULLIF(pmd.guild_team_name, ''),
-                CASE
-                    WHEN pmd.team_side = 'home' THEN m.home_team_name
-                    WHEN pmd.team_side = 'away' THEN m.away_team_name
-                    ELSE NULL
-                END
-            ) AS resolved_team_name,
-            ROW_NUMBER() OVER (
-                PARTITION BY pmd.steam_id
-                ORDER BY COALESCE(pmd.source_updated_at, m.source_updated_at, m.match_datetime) DESC, pmd.match_stats_id DESC
-            ) AS row_num
-        FROM hub_match_player_stats pmd
-        LEFT JOIN hub_matches m ON m.match_stats_id = pmd.match_stats_id
-        WHERE pmd.team_guild_id IS NOT NULL OR pmd.team_side IN ('home', 'away')
-    ) latest
-    WHERE latest.row_num = 1
-"""
-
-PLAYER_DETAILED_POSITION_SUBQUERY = """
-    SELECT
-        ranked.steam_id,
-        ranked.position_code AS primary_position
-    FROM (
-        SELECT
-            aggregated.steam_id,
-            aggregated.position_code,
-            ROW_NUMBER() OVER (
-                PARTITION BY aggregated.steam_id
-                ORDER BY aggregated.appearances_at_position DESC, aggregated.last_used_at DESC, aggregated.position_code ASC
-            ) AS row_num
-        FROM (
-            SELECT
-                pmd.steam_id,
-                UPPER(TRIM(pmd.position_code)) AS position_code,
-                COUNT(*) AS appearances_at_position,
-                MAX(COALESCE(pmd.source_updated_at, m.source_updated_at, m.match_datetime)) AS last_used_at
-            FROM hub_match_player_stats pmd
-            LEFT JOIN hub_matches m ON m.match_stats_id = pmd.match_stats_id
-            WHERE pmd.position_code IS NOT NULL
-              AND TRIM(pmd.position_code) <> ''
-            GROUP BY pmd.steam_id, UPPER(TRIM(pmd.position_code))
-        ) aggregated
-    ) ranked
-    WHERE ranked.row_num = 1
-"""
-
 PLAYER_SELECT_FIELDS = """
     p.steam_id,
     p.discord_id,
     p.display_name,
-    COALESCE(
-        (
-            SELECT profile.avatar_url
-            FROM hub_profile_overrides profile
-            WHERE profile.owner_type = 'player'
-              AND profile.owner_key = p.steam_id
-            LIMIT 1
-        ),
-        (
-            SELECT profile.avatar_url
-            FROM hub_profile_overrides profile
-            WHERE profile.owner_type = 'discord_user'
-              AND profile.owner_key = p.discord_id::text
-            LIMIT 1
-        )
-    ) AS avatar_url,
+    COALESCE(player_profile.avatar_url, discord_profile.avatar_url) AS avatar_url,
     COALESCE(position_history.primary_position, p.primary_position) AS primary_position,
     p.rating,
     p.atk_rating,
@@ -356,8 +323,14 @@ def build_player_select_from(existing_columns: set[str] | None = None) -> str:
     return f"""
     FROM hub_players p
     LEFT JOIN ({build_player_stats_subquery(existing_columns)}) stats ON stats.steam_id = p.steam_id
-    LEFT JOIN ({CURRENT_PLAYER_TEAM_SUBQUERY}) current_team ON current_team.steam_id = p.steam_id
-    LEFT JOIN ({PLAYER_DETAILED_POSITION_SUBQUERY}) position_history ON position_history.steam_id = p.steam_id
+    LEFT JOIN mv_hub_player_current_team current_team ON current_team.steam_id = p.steam_id
+    LEFT JOIN mv_hub_player_primary_position position_history ON position_history.steam_id = p.steam_id
+    LEFT JOIN hub_profile_overrides player_profile
+      ON player_profile.owner_type = 'player'
+     AND player_profile.owner_key = p.steam_id
+    LEFT JOIN hub_profile_overrides discord_profile
+      ON discord_profile.owner_type = 'discord_user'
+     AND discord_profile.owner_key = p.discord_id::text
 """
 
 MATCH_SELECT_FIELDS = """
@@ -391,7 +364,7 @@ MATCH_SELECT_FIELDS = """
 """
 
 MATCH_SELECT_FROM = """
-    FROM v_hub_match_overview m
+    FROM mv_hub_match_overview m
     LEFT JOIN hub_tournament_fixtures fixture ON fixture.played_match_stats_id = m.match_stats_id
     LEFT JOIN hub_tournaments tournament ON tournament.tournament_id = fixture.tournament_id
 """
@@ -402,6 +375,9 @@ HUB_RELATIONS = (
     "v_hub_tournament_standings_enriched",
     "v_hub_team_profile_summary",
     "v_hub_match_overview",
+    "mv_hub_match_overview",
+    "mv_hub_player_current_team",
+    "mv_hub_player_primary_position",
     "v_hub_player_totals",
     "hub_player_rating_history",
     "hub_match_events",
@@ -418,6 +394,12 @@ HUB_RELATIONS = (
     "hub_teams",
     "hub_players",
 )
+HUB_RELATION_RE = re.compile(
+    r"(?<![\w\.\"])("
+    + "|".join(sorted(HUB_RELATIONS, key=len, reverse=True))
+    + r")(?![\w\"])"
+)
+HUB_RELATION_REPLACEMENT = f'"{config.HUB_POSTGRES_SCHEMA}".\\1'
 
 
 def _to_postgres_sql(sql: str) -> str:
@@ -432,27 +414,24 @@ def _to_postgres_sql(sql: str) -> str:
 
 
 def _qualify_hub_sql(sql: str) -> str:
-    qualified = sql
-    for relation in HUB_RELATIONS:
-        qualified = re.sub(
-            rf"(?<![\w\.\"])({relation})(?![\w\"])",
-            f'"{config.HUB_POSTGRES_SCHEMA}".{relation}',
-            qualified,
-        )
-    return qualified
+    return HUB_RELATION_RE.sub(HUB_RELATION_REPLACEMENT, sql)
+
+
+@lru_cache(maxsize=512)
+def _prepare_hub_sql(sql: str) -> str:
+    return _to_postgres_sql(_qualify_hub_sql(sql))
 
 
 def _cache_key_from_sql(namespace: str, sql: str, params: tuple[Any, ...]) -> str:
     normalized_sql = " ".join(sql.split())
-    payload = json.dumps(
+    payload = orjson.dumps(
         {
             "sql": normalized_sql,
             "params": public_row(list(params)),
         },
-        separators=(",", ":"),
-        sort_keys=True,
+        option=orjson.OPT_SORT_KEYS,
     )
-    digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+    digest = hashlib.sha1(payload).hexdigest()
     return f"{config.REDIS_KEY_PREFIX}:{namespace}:{digest}"
 
 
@@ -473,10 +452,10 @@ async def fetch_all(
 
     try:
         rows = await asyncio.wait_for(
-            request.app.state.hub_pool.fetch(_to_postgres_sql(_qualify_hub_sql(sql)), *params),
+            request.app.state.hub_pool.fetch(_prepare_hub_sql(sql), *params),
             timeout=config.HUB_DB_QUERY_TIMEOUT_SECONDS,
         )
-        values = public_rows([dict(row) for row in rows])
+        values = [dict(row) for row in rows]
         if cache_key is not None:
             await cache.set_json(redis_client, cache_key, values, ttl)
         return values
@@ -502,10 +481,10 @@ async def fetch_one(
 
     try:
         row = await asyncio.wait_for(
-            request.app.state.hub_pool.fetchrow(_to_postgres_sql(_qualify_hub_sql(sql)), *params),
+            request.app.state.hub_pool.fetchrow(_prepare_hub_sql(sql), *params),
             timeout=config.HUB_DB_QUERY_TIMEOUT_SECONDS,
         )
-        value = public_row(dict(row)) if row else None
+        value = dict(row) if row else None
         if cache_key is not None and value is not None:
             await cache.set_json(redis_client, cache_key, value, ttl)
         return value
@@ -513,6 +492,19 @@ async def fetch_one(
         raise HTTPException(status_code=504, detail="Hub database query timed out") from exc
 
 
+DETAIL_QUERY_CONCURRENCY = 3
+
+
+async def _gather_limited(*aws, limit: int = DETAIL_QUERY_CONCURRENCY) -> list[Any]:
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws))
+
+
 TOURNAMENT_MATCH_ROWS_CTE = """
 WITH tournament_match_rows AS (
     SELECT
@@ -837,9 +829,52 @@ async def _get_latest_hub_sync_token(request: Request) -> str:
         cache_namespace="sync-token",
     )
     token = row.get("sync_token") if isinstance(row, dict) else None
+    if isinstance(token, datetime):
+        return token.isoformat()
     return str(token) if token is not None else "no-sync"
 
 
+def _body_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _etag_response(request: Request, body: bytes, etag: str) -> Response:
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match and (if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+def json_response(request: Request, payload: Any) -> Response:
+    body = dumps_public(payload)
+    return _etag_response(request, body, _body_etag(body))
+
+
+_RESPONSE_CACHE_LOCKS: dict[str, asyncio.Lock] = {}
+
+
+async def cached_json_response(request: Request, namespace: str, cache_token: str, loader, *, ttl: int) -> Response:
+    if ttl <= 0:
+        return json_response(request, await loader())
+
+    cache_key = f"{namespace}:{cache_token}"
+    cached = cache.get_local_response(cache_key)
+    if cached is None:
+        lock = _RESPONSE_CACHE_LOCKS.setdefault(cache_key, asyncio.Lock())
+        try:
+            async with lock:
+                cached = cache.get_local_response(cache_key)
+                if cached is None:
+                    payload = await fetch_cached_payload(request, namespace, cache_token, loader, ttl=ttl)
+                    body = dumps_public(payload)
+                    cached = (body, _body_etag(body))
+                    cache.set_local_response(cache_key, *cached, ttl)
+        finally:
+            if _RESPONSE_CACHE_LOCKS.get(cache_key) is lock:
+                _RESPONSE_CACHE_LOCKS.pop(cache_key, None)
+    return _etag_response(request, *cached)
+
+
 def _parse_public_datetime(value: Any) -> datetime | None:
     if isinstance(value, datetime):
         return value
@@ -865,14 +900,23 @@ def _is_historical_match(value: Any) -> bool:
 
 @app.get("/health")
 async def health(request: Request):
+    pool = request.app.state.hub_pool
     try:
         value = await asyncio.wait_for(
-            request.app.state.hub_pool.fetchval("SELECT 1"),
+            pool.fetchval("SELECT 1"),
             timeout=config.HUB_DB_QUERY_TIMEOUT_SECONDS,
         )
     except asyncio.TimeoutError as exc:
         raise HTTPException(status_code=504, detail="Hub database query timed out") from exc
-    return {"ok": bool(value == 1)}
+    return {
+        "ok": bool(value == 1),
+        "pool": {
+            "size": pool.get_size(),
+            "idle": pool.get_idle_size(),
+            "min_size": pool.get_min_size(),
+            "max_size": pool.get_max_size(),
+        },
+    }
 
 
 @app.get("/api/players")
@@ -893,17 +937,27 @@ async def list_players(
         params.extend([like, like])
 
     params.extend([limit, offset])
-    return await fetch_all(
+
+    async def load_players():
+        return await fetch_all(
+            request,
+            f"""
+            SELECT {PLAYER_SELECT_FIELDS}
+            {player_select_from}
+            {where}
+            ORDER BY p.rating DESC, p.display_name ASC
+            LIMIT %s OFFSET %s
+            """,
+            tuple(params),
+            cache_ttl=0,
+        )
+
+    return await cached_json_response(
         request,
-        f"""
-        SELECT {PLAYER_SELECT_FIELDS}
-        {player_select_from}
-        {where}
-        ORDER BY p.rating DESC, p.display_name ASC
-        LIMIT %s OFFSET %s
-        """,
-        tuple(params),
-        cache_ttl=0,
+        "players",
+        f"{limit}:{offset}",
+        load_players,
+        ttl=0 if where else config.LIST_CACHE_TTL_SECONDS,
     )
 
 
@@ -912,7 +966,7 @@ async def get_player(request: Request, steam_id: str):
     player_select_from = build_player_select_from(
         getattr(request.app.state, "hub_match_player_stats_columns", set()),
     )
-    player = await fetch_one(
+    player_task = fetch_one(
         request,
         f"""
         SELECT {PLAYER_SELECT_FIELDS}
@@ -922,10 +976,7 @@ async def get_player(request: Request, steam_id: str):
         (steam_id,),
         cache_ttl=0,
     )
-    if not player:
-        raise HTTPException(status_code=404, detail="Player not found")
-
-    player["recent_matches"] = await fetch_all(
+    recent_matches_task = fetch_all(
         request,
         f"""
         SELECT
@@ -957,7 +1008,12 @@ async def get_player(request: Request, steam_id: str):
         (steam_id,),
         cache_ttl=0,
     )
-    return player
+    player, recent_matches = await _gather_limited(player_task, recent_matches_task)
+    if not player:
+        raise HTTPException(status_code=404, detail="Player not found")
+
+    player["recent_matches"] = recent_matches
+    return json_response(request, player)
 
 
 async def _load_matchmaking_monthly_leaders(
@@ -966,72 +1022,51 @@ async def _load_matchmaking_monthly_leaders(
     window_days: int = 30,
     limit: int = 5,
 ) -> dict[str, list[dict[str, Any]]]:
-    params = (window_days, limit)
-    scorers = await fetch_all(
-        request,
-        """
-        SELECT
-            pmd.steam_id,
-            COUNT(DISTINCT pmd.match_stats_id) AS appearances,
-            COALESCE(SUM(pmd.goals), 0) AS value
-        FROM hub_match_player_stats pmd
-        JOIN hub_matches m ON m.match_stats_id = pmd.match_stats_id
-        LEFT JOIN hub_tournament_fixtures fixture ON fixture.played_match_stats_id = m.match_stats_id
-        WHERE m.match_datetime >= NOW() - (%s::int * INTERVAL '1 day')
-          AND fixture.played_match_stats_id IS NULL
-        GROUP BY pmd.steam_id
-        HAVING COALESCE(SUM(pmd.goals), 0) > 0
-        ORDER BY value DESC, appearances DESC, pmd.steam_id ASC
-        LIMIT %s
-        """,
-        params,
-        cache_ttl=0,
-    )
-    assisters = await fetch_all(
-        request,
-        """
-        SELECT
-            pmd.steam_id,
-            COUNT(DISTINCT pmd.match_stats_id) AS appearances,
-            COALESCE(SUM(pmd.assists), 0) AS value
-        FROM hub_match_player_stats pmd
-        JOIN hub_matches m ON m.match_stats_id = pmd.match_stats_id
-        LEFT JOIN hub_tournament_fixtures fixture ON fixture.played_match_stats_id = m.match_stats_id
-        WHERE m.match_datetime >= NOW() - (%s::int * INTERVAL '1 day')
-          AND fixture.played_match_stats_id IS NULL
-        GROUP BY pmd.steam_id
-        HAVING COALESCE(SUM(pmd.assists), 0) > 0
-        ORDER BY value DESC, appearances DESC, pmd.steam_id ASC
-        LIMIT %s
-        """,
-        params,
-        cache_ttl=0,
-    )
-    saves = await fetch_all(
+    rows = await fetch_all(
         request,
         """
-        SELECT
-            pmd.steam_id,
-            COUNT(DISTINCT pmd.match_stats_id) AS appearances,
-            COALESCE(SUM(pmd.keeper_saves), 0) AS value
-        FROM hub_match_player_stats pmd
-        JOIN hub_matches m ON m.match_stats_id = pmd.match_stats_id
-        LEFT JOIN hub_tournament_fixtures fixture ON fixture.played_match_stats_id = m.match_stats_id
-        WHERE m.match_datetime >= NOW() - (%s::int * INTERVAL '1 day')
-          AND fixture.played_match_stats_id IS NULL
-        GROUP BY pmd.steam_id
-        HAVING COALESCE(SUM(pmd.keeper_saves), 0) > 0
-        ORDER BY value DESC, appearances DESC, pmd.steam_id ASC
-        LIMIT %s
+        WITH totals AS (
+            SELECT
+                pmd.steam_id,
+                COUNT(DISTINCT pmd.match_stats_id) AS appearances,
+                COALESCE(SUM(pmd.goals), 0) AS goals,
+                COALESCE(SUM(pmd.assists), 0) AS assists,
+                COALESCE(SUM(pmd.keeper_saves), 0) AS saves
+            FROM hub_match_player_stats pmd
+            JOIN hub_matches m ON m.match_stats_id = pmd.match_stats_id
+            LEFT JOIN hub_tournament_fixtures fixture ON fixture.played_match_stats_id = m.match_stats_id
+            WHERE m.match_datetime >= NOW() - (%s::int * INTERVAL '1 day')
+              AND fixture.played_match_stats_id IS NULL
+            GROUP BY pmd.steam_id
+        ),
+        ranked AS (
+            SELECT
+                board.category,
+                totals.steam_id,
+                totals.appearances,
+                board.value,
+                ROW_NUMBER() OVER (
+                    PARTITION BY board.category
+                    ORDER BY board.value DESC, totals.appearances DESC, totals.steam_id ASC
+                ) AS leader_rank
+            FROM totals
+            CROSS JOIN LATERAL (
+                VALUES ('scorers', totals.goals), ('assisters', totals.assists), ('saves', totals.saves)
+            ) AS board(category, value)
+            WHERE board.value > 0
+        )
+        SELECT category, steam_id, appearances, value
+        FROM ranked
+        WHERE leader_rank <= %s
+        ORDER BY category, leader_rank
         """,
-        params,
+        (window_days, limit),
         cache_ttl=0,
     )
-    return {
-        "scorers": scorers,
-        "assisters": assisters,
-        "saves": saves,
-    }
+    leaders: dict[str, list[dict[str, Any]]] = {"scorers": [], "assisters": [], "saves": []}
+    for row in rows:
+        leaders[row.pop("category")].append(row)
+    return leaders
 
 
 @app.get("/api/matchmaking/leaders")
@@ -1051,41 +1086,67 @@ async def matchmaking_leaders(
 
 @app.get("/api/teams")
 async def list_teams(request: Request, limit: int = Query(100, ge=1, le=250), offset: int = Query(0, ge=0)):
-    return await fetch_all(
-        request,
-        """
-        SELECT *
-        FROM v_hub_team_profile_summary
-        ORDER BY average_rating DESC, name ASC
-        LIMIT %s OFFSET %s
-        """,
-        (limit, offset),
-        cache_ttl=0,
-    )
+    async def load_teams():
+        return await fetch_all(
+            request,
+            """
+            SELECT *
+            FROM v_hub_team_profile_summary
+            ORDER BY average_rating DESC, name ASC
+            LIMIT %s OFFSET %s
+            """,
+            (limit, offset),
+            cache_ttl=0,
+        )
+
+    return await cached_json_response(request, "teams", f"{limit}:{offset}", load_teams, ttl=config.LIST_CACHE_TTL_SECONDS)
 
 
 @app.get("/api/teams/{guild_id}")
 async def get_team(request: Request, guild_id: str):
+    return await cached_json_response(
+        request,
+        "team",
+        guild_id,
+        lambda: _load_team(request, guild_id),
+        ttl=config.LIST_CACHE_TTL_SECONDS,
+    )
+
+
+async def _load_team(request: Request, guild_id: str) -> dict[str, Any]:
     player_select_from = build_player_select_from(
         getattr(request.app.state, "hub_match_player_stats_columns", set()),
     )
-    team = await fetch_one(request, "SELECT * FROM v_hub_team_profile_summary WHERE guild_id = %s", (guild_id,), cache_ttl=0)
-    if not team:
-        raise HTTPException(status_code=404, detail="Team not found")
-
-    team["recent_matches"] = await fetch_all(
+    team_task = fetch_one(request, "SELECT * FROM v_hub_team_profile_summary WHERE guild_id = %s", (guild_id,), cache_ttl=0)
+    recent_matches_task = fetch_all(
         request,
         f"""
         SELECT {MATCH_SELECT_FIELDS}
         {MATCH_SELECT_FROM}
-        WHERE m.home_guild_id = %s OR m.away_guild_id = %s
+        WHERE m.match_stats_id IN (
+            (
+                SELECT match_stats_id
+                FROM mv_hub_match_overview
+                WHERE home_guild_id = %s
+                ORDER BY match_datetime DESC
+                LIMIT 20
+            )
+            UNION
+            (
+                SELECT match_stats_id
+                FROM mv_hub_match_overview
+                WHERE away_guild_id = %s
+                ORDER BY match_datetime DESC
+                LIMIT 20
+            )
+        )
         ORDER BY m.match_datetime DESC
         LIMIT 20
         """,
         (guild_id, guild_id),
         cache_ttl=0,
     )
-    team["players"] = await fetch_all(
+    players_task = fetch_all(
         request,
         f"""
         SELECT {PLAYER_SELECT_FIELDS}
@@ -1096,7 +1157,7 @@ async def get_team(request: Request, guild_id: str):
         (guild_id,),
         cache_ttl=0,
     )
-    team["aggregate_player_stats"] = await fetch_one(
+    aggregate_player_stats_task = fetch_one(
         request,
         """
         SELECT
@@ -1143,6 +1204,18 @@ async def get_team(request: Request, guild_id: str):
         (guild_id,),
         cache_ttl=0,
     )
+    team, recent_matches, players, aggregate_player_stats = await _gather_limited(
+        team_task,
+        recent_matches_task,
+        players_task,
+        aggregate_player_stats_task,
+    )
+    if not team:
+        raise HTTPException(status_code=404, detail="Team not found")
+
+    team["recent_matches"] = recent_matches
+    team["players"] = players
+    team["aggregate_player_stats"] = aggregate_player_stats
     return team
 
 
@@ -1160,7 +1233,7 @@ async def list_matches(
         params.extend([team_id, team_id])
     params.extend([limit, offset])
 
-    return await fetch_all(
+    return json_response(request, await fetch_all(
         request,
         f"""
         SELECT {MATCH_SELECT_FIELDS}
@@ -1171,7 +1244,7 @@ async def list_matches(
         """,
         tuple(params),
         cache_ttl=0,
-    )
+    ))
 
 
 @app.get("/api/matches/{match_stats_id}")
@@ -1191,30 +1264,63 @@ async def get_match(request: Request, match_stats_id: int):
 
     detail_cache_ttl = config.API_CACHE_TTL_SECONDS if _is_historical_match(match.get("match_datetime")) else 0
 
-    match["lineups"] = await fetch_all(
+    lineups_task = fetch_all(
         request,
         "SELECT * FROM hub_match_lineups WHERE match_stats_id = %s ORDER BY side, slot_order, position_code",
         (match_stats_id,),
         cache_ttl=detail_cache_ttl,
     )
-    match["player_stats"] = await fetch_all(
+    player_stats_task = fetch_all(
         request,
         "SELECT * FROM hub_match_player_stats WHERE match_stats_id = %s ORDER BY team_side, position_code, player_name",
         (match_stats_id,),
         cache_ttl=detail_cache_ttl,
     )
-    match["events"] = await fetch_all(
+    events_task = fetch_all(
         request,
-        "SELECT * FROM hub_match_events WHERE match_stats_id = %s ORDER BY match_second, event_index",
+        """
+        SELECT
+            source_event_id,
+            match_stats_id,
+            match_id,
+            event_index,
+            event_type,
+            raw_event,
+            team_side,
+            team_guild_id,
+            period,
+            raw_second,
+            match_second,
+            minute,
+            clock,
+            player1_steam_id,
+            player2_steam_id,
+            player3_steam_id,
+            body_part,
+            x,
+            y,
+            norm_x,
+            norm_y,
+            raw_event_payload::text AS raw_event_payload,
+            synced_at
+        FROM hub_match_events
+        WHERE match_stats_id = %s
+        ORDER BY match_second, event_index
+        """,
         (match_stats_id,),
         cache_ttl=detail_cache_ttl,
     )
-    return match
+    match["lineups"], match["player_stats"], match["events"] = await _gather_limited(
+        lineups_task,
+        player_stats_task,
+        events_task,
+    )
+    return json_response(request, match)
 
 
 @app.get("/api/tournaments")
 async def list_tournaments(request: Request, limit: int = Query(50, ge=1, le=100), offset: int = Query(0, ge=0)):
-    return await fetch_all(
+    return json_response(request, await fetch_all(
         request,
         """
         SELECT *
@@ -1224,28 +1330,25 @@ async def list_tournaments(request: Request, limit: int = Query(50, ge=1, le=100
         """,
         (limit, offset),
         cache_ttl=0,
-    )
+    ))
 
 
 @app.get("/api/tournaments/{tournament_id}")
 async def get_tournament(request: Request, tournament_id: int):
-    tournament = await fetch_one(request, "SELECT * FROM hub_tournaments WHERE tournament_id = %s", (tournament_id,), cache_ttl=0)
-    if not tournament:
-        raise HTTPException(status_code=404, detail="Tournament not found")
-
-    tournament["teams"] = await fetch_all(
+    tournament_task = fetch_one(request, "SELECT * FROM hub_tournaments WHERE tournament_id = %s", (tournament_id,), cache_ttl=0)
+    teams_task = fetch_all(
         request,
         "SELECT * FROM hub_tournament_teams WHERE tournament_id = %s ORDER BY league_key, seed, team_name",
         (tournament_id,),
         cache_ttl=0,
     )
-    tournament["standings"] = await fetch_all(
+    standings_task = fetch_all(
         request,
         "SELECT * FROM v_hub_tournament_standings_enriched WHERE tournament_id = %s ORDER BY points DESC, goal_diff DESC, goals_for DESC, team_name ASC",
         (tournament_id,),
         cache_ttl=0,
     )
-    tournament["fixtures"] = await fetch_all(
+    fixtures_task = fetch_all(
         request,
         """
         SELECT
@@ -1268,7 +1371,7 @@ async def get_tournament(request: Request, tournament_id: int):
                 m.home_score,
                 m.away_score,
                 m.game_type
-            FROM v_hub_match_overview m
+            FROM mv_hub_match_overview m
         ) played ON played.match_stats_id = fixture.played_match_stats_id
         WHERE fixture.tournament_id = %s
         ORDER BY fixture.league_key, (fixture.week_number IS NULL), fixture.week_number, fixture.fixture_id
@@ -1276,13 +1379,38 @@ async def get_tournament(request: Request, tournament_id: int):
         (tournament_id,),
         cache_ttl=0,
     )
+    (
+        tournament,
+        teams,
+        standings,
+        fixtures,
+        player_totals,
+        team_metrics,
+        performance_extremes,
+        team_of_the_week,
+    ) = await _gather_limited(
+        tournament_task,
+        teams_task,
+        standings_task,
+        fixtures_task,
+        build_tournament_player_totals(request, tournament_id),
+        build_tournament_team_metrics(request, tournament_id),
+        build_tournament_performance_extremes(request, tournament_id),
+        build_tournament_team_of_week(request, tournament_id),
+    )
+    if not tournament:
+        raise HTTPException(status_code=404, detail="Tournament not found")
+
+    tournament["teams"] = teams
+    tournament["standings"] = standings
+    tournament["fixtures"] = fixtures
     tournament["analytics"] = {
-        "player_totals": await build_tournament_player_totals(request, tournament_id),
-        "team_metrics": await build_tournament_team_metrics(request, tournament_id),
-        "performance_extremes": await build_tournament_performance_extremes(request, tournament_id),
-        "team_of_the_week": await build_tournament_team_of_week(request, tournament_id),
+        "player_totals": player_totals,
+        "team_metrics": team_metrics,
+        "performance_extremes": performance_extremes,
+        "team_of_the_week": team_of_the_week,
     }
-    return tournament
+    return json_response(request, tournament)
 
 
 @app.get("/api/media")
@@ -1299,7 +1427,7 @@ async def list_media(
         params.append(media_type.strip())
     params.extend([limit, offset])
 
-    return await fetch_all(
+    return json_response(request, await fetch_all(
         request,
         f"""
         SELECT *
@@ -1309,24 +1437,42 @@ async def list_media(
         LIMIT %s OFFSET %s
         """,
         tuple(params),
-    )
+    ))
 
 
 @app.get("/api/summary")
 async def hub_summary(request: Request):
+    return await cached_json_response(
+        request,
+        "summary",
+        "all",
+        lambda: _load_hub_summary(request),
+        ttl=config.SUMMARY_CACHE_TTL_SECONDS,
+    )
+
+
+async def _load_hub_summary(request: Request) -> dict[str, Any] | None:
     return await fetch_one(
         request,
         """
+        WITH live_counts AS (
+            SELECT
+                MAX(n_live_tup) FILTER (WHERE relname = %s) AS players,
+                MAX(n_live_tup) FILTER (WHERE relname = %s) AS teams,
+                MAX(n_live_tup) FILTER (WHERE relname = %s) AS matches
+            FROM pg_stat_user_tables
+            WHERE schemaname = %s
+        )
         SELECT
-            (SELECT COUNT(*) FROM hub_players) AS total_players,
+            COALESCE(NULLIF((SELECT players FROM live_counts), 0), (SELECT COUNT(*) FROM hub_players)) AS total_players,
             (
                 SELECT COUNT(DISTINCT pmd.steam_id)
                 FROM hub_match_player_stats pmd
                 JOIN hub_matches m ON m.match_stats_id = pmd.match_stats_id
                 WHERE m.match_datetime >= NOW() - INTERVAL '7 days'
             ) AS active_players_last_7_days,
-            (SELECT COUNT(*) FROM hub_teams) AS total_teams,
-            (SELECT COUNT(*) FROM hub_matches) AS total_matches,
+            COALESCE(NULLIF((SELECT teams FROM live_counts), 0), (SELECT COUNT(*) FROM hub_teams)) AS total_teams,
+            COALESCE(NULLIF((SELECT matches FROM live_counts), 0), (SELECT COUNT(*) FROM hub_matches)) AS total_matches,
             (
                 SELECT COUNT(*)
                 FROM hub_matches
@@ -1343,7 +1489,7 @@ async def hub_summary(request: Request):
                 WHERE sync_key = 'full_sync'
             ) AS last_full_sync_at
         """,
-        (),
+        ("hub_players", "hub_teams", "hub_matches", config.HUB_POSTGRES_SCHEMA),
         cache_ttl=0,
         cache_namespace="summary",
     )
@@ -1410,10 +1556,10 @@ async def hub_bootstrap(request: Request):
             (),
             cache_ttl=0,
         )
-        summary_task = hub_summary(request)
+        summary_task = _load_hub_summary(request)
         matchmaking_leaders_task = _load_matchmaking_monthly_leaders(request)
 
-        teams, players, matches, tournaments, media, summary, matchmaking_leaders = await asyncio.gather(
+        teams, players, matches, tournaments, media, summary, matchmaking_leaders = await _gather_limited(
             teams_task,
             players_task,
             matches_task,
@@ -1433,12 +1579,12 @@ async def hub_bootstrap(request: Request):
             "matchmaking_leaders": matchmaking_leaders,
         }
 
-    return await fetch_cached_payload(
+    return await cached_json_response(
         request,
         "bootstrap",
         cache_token,
         load_payload,
-        ttl=0,
+        ttl=config.BOOTSTRAP_CACHE_TTL_SECONDS,
     )
 
 
@@ -1515,7 +1661,7 @@ async def auth_logout(request: Request):
         request.app.state.hub_pool,
         request.cookies.get(config.HUB_SESSION_COOKIE_NAME),
     )
-    response = JSONResponse({"ok": True})
+    response = ORJSONResponse({"ok": True})
     auth.clear_session_cookie(response)
     return response
 
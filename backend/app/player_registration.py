@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import json
+import asyncio
 from datetime import datetime
 import hashlib
 from typing import Any
 
+import orjson
 from fastapi import HTTPException
 
 from . import config
 
 ID64_BASE = 76561197960265728
 
+_ACCOUNT_LINKING_SCHEMA_READY = False
+_ACCOUNT_LINKING_SCHEMA_LOCK = asyncio.Lock()
+_IOSCA_PLAYERS_COLUMNS: dict[str, str] | None = None
+
 
 def _token_hash(token: str) -> str:
     return hashlib.sha256(str(token or "").encode("utf-8")).hexdigest()
@@ -53,6 +58,16 @@ def normalize_steam_id(value: str | None) -> str | None:
 
 
 async def ensure_account_linking_schema(pool) -> None:
+    global _ACCOUNT_LINKING_SCHEMA_READY
+    if _ACCOUNT_LINKING_SCHEMA_READY:
+        return
+    async with _ACCOUNT_LINKING_SCHEMA_LOCK:
+        if not _ACCOUNT_LINKING_SCHEMA_READY:
+            await _create_account_linking_schema(pool)
+            _ACCOUNT_LINKING_SCHEMA_READY = True
+
+
+async def _create_account_linking_schema(pool) -> None:
     async with pool.acquire() as conn:
         async with conn.transaction():
             await conn.execute(
@@ -198,30 +213,28 @@ async def get_registration_status(pool, token: str, hub_user_id: int | None = No
         }
 
 
+async def _iosca_players_columns(conn) -> dict[str, str]:
+    global _IOSCA_PLAYERS_COLUMNS
+    if _IOSCA_PLAYERS_COLUMNS is None:
+        rows = await conn.fetch(
+            """
+            SELECT column_name, data_type
+            FROM information_schema.columns
+            WHERE table_schema = 'public'
+              AND table_name = 'iosca_players'
+            """
+        )
+        _IOSCA_PLAYERS_COLUMNS = {str(row["column_name"]): str(row["data_type"]) for row in rows}
+    return _IOSCA_PLAYERS_COLUMNS
+
+
 async def _discord_column_expects_text(conn) -> bool:
-    row = await conn.fetchrow(
-        """
-        SELECT data_type
-        FROM information_schema.columns
-        WHERE table_schema = 'public'
-          AND table_name = 'iosca_players'
-          AND column_name = 'discord_id'
-        """
-    )
-    return bool(row and str(row["data_type"]) in {"character varying", "text"})
+    columns = await _iosca_players_columns(conn)
+    return columns.get("discord_id") in {"character varying", "text"}
 
 
 async def _name_column(conn) -> str | None:
-    rows = await conn.fetch(
-        """
-        SELECT column_name
-        FROM information_schema.columns
-        WHERE table_schema = 'public'
-          AND table_name = 'iosca_players'
-          AND column_name IN ('discord_name', 'username')
-        """
-    )
-    columns = {str(row["column_name"]) for row in rows}
+    columns = await _iosca_players_columns(conn)
     if "discord_name" in columns:
         return "discord_name"
     if "username" in columns:
@@ -352,7 +365,7 @@ async def _reconcile_iosca_player(
                 discord_value,
                 display_name,
                 steam_id_to_write,
-                json.dumps(aliases),
+                orjson.dumps(aliases).decode(),
                 str(target_row["row_token"]),
             )
         else:
@@ -367,7 +380,7 @@ async def _reconcile_iosca_player(
                 """,
                 discord_value,
                 steam_id_to_write,
-                json.dumps(aliases),
+                orjson.dumps(aliases).decode(),
                 str(target_row["row_token"]),
             )
     else:
@@ -380,7 +393,7 @@ async def _reconcile_iosca_player(
                 discord_value,
                 display_name,
                 steam_id_to_write,
-                json.dumps(aliases),
+                orjson.dumps(aliases).decode(),
             )
         else:
             await conn.execute(
@@ -390,7 +403,7 @@ async def _reconcile_iosca_player(
                 """,
                 discord_value,
                 steam_id_to_write,
-                json.dumps(aliases),
+                orjson.dumps(aliases).decode(),
             )
 
     return {
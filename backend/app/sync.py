@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Iterable
 
 import asyncpg
@@ -11,10 +12,15 @@ from . import config
 
 
 PLAYER_MATCH_JOIN_SQL = """
-(
-    pmd.match_id::text = ms.match_id::text
-    OR pmd.match_id::text = ms.id::text
-)
+JOIN (
+    SELECT id AS match_stats_id, match_id::text AS match_key
+    FROM match_stats
+    WHERE match_id IS NOT NULL
+    UNION
+    SELECT id AS match_stats_id, id::text AS match_key
+    FROM match_stats
+) match_keys ON match_keys.match_key = pmd.match_id::text
+JOIN match_stats ms ON ms.id = match_keys.match_stats_id
 """
 
 
@@ -64,6 +70,7 @@ def _hub_relation(name: str) -> str:
     return f'"{config.HUB_POSTGRES_SCHEMA}".{name}'
 
 
+@lru_cache(maxsize=16384, typed=True)
 def _normalize_discord_identifier(value: Any) -> str | None:
     text = _stringify_identifier(value)
     if text is None:
@@ -181,11 +188,11 @@ async def _replace_scoped_rows(
                     *scope_values,
                 )
             if rows:
-                col_sql = ", ".join(f'"{col}"' for col in columns)
-                placeholders = ", ".join(f"${index}" for index in range(1, len(columns) + 1))
-                await conn.executemany(
-                    f"INSERT INTO {_hub_relation(table)} ({col_sql}) VALUES ({placeholders})",
-                    [tuple(row.get(col) for col in columns) for row in rows],
+                await conn.copy_records_to_table(
+                    table,
+                    schema_name=config.HUB_POSTGRES_SCHEMA,
+                    columns=columns,
+                    records=[tuple(row.get(col) for col in columns) for row in rows],
                 )
     return len(rows)
 
@@ -300,8 +307,7 @@ async def _fetch_changed_match_scope_for_player_stats(
                 ms.id AS match_stats_id,
                 COALESCE(pmd.updated_at, ms.updated_at, ms.datetime) AS changed_at
             FROM player_match_data pmd
-            JOIN match_stats ms
-              ON {PLAYER_MATCH_JOIN_SQL}
+            {PLAYER_MATCH_JOIN_SQL}
             WHERE COALESCE(pmd.updated_at, ms.updated_at, ms.datetime) > $1
         ) changed
         GROUP BY changed.match_stats_id
@@ -480,8 +486,7 @@ async def sync_matches(pg_pool: asyncpg.Pool, hub_pool: asyncpg.Pool, *, force_f
                 SELECT
                     ms.id AS match_stats_id
                 FROM player_match_data pmd
-                JOIN match_stats ms
-                  ON {PLAYER_MATCH_JOIN_SQL}
+                {PLAYER_MATCH_JOIN_SQL}
                 WHERE pmd.is_match_mvp = true
                   AND COALESCE(pmd.updated_at, ms.updated_at, ms.datetime) > $1
             ) changed
@@ -494,8 +499,7 @@ async def sync_matches(pg_pool: asyncpg.Pool, hub_pool: asyncpg.Pool, *, force_f
                 pmd.match_rating AS mvp_match_rating,
                 COALESCE(pmd.updated_at, ms.updated_at, ms.datetime) AS mvp_source_updated_at
             FROM player_match_data pmd
-            JOIN match_stats ms
-              ON {PLAYER_MATCH_JOIN_SQL}
+            {PLAYER_MATCH_JOIN_SQL}
             WHERE pmd.is_match_mvp = true
             ORDER BY pmd.match_id::text, pmd.match_rating DESC NULLS LAST, pmd.id
         )
@@ -535,8 +539,7 @@ async def sync_matches(pg_pool: asyncpg.Pool, hub_pool: asyncpg.Pool, *, force_f
                 pmd.match_rating AS mvp_match_rating,
                 COALESCE(pmd.updated_at, ms.updated_at, ms.datetime) AS mvp_source_updated_at
             FROM player_match_data pmd
-            JOIN match_stats ms
-              ON {PLAYER_MATCH_JOIN_SQL}
+            {PLAYER_MATCH_JOIN_SQL}
             WHERE pmd.is_match_mvp = true
             ORDER BY pmd.match_id::text, pmd.match_rating DESC NULLS LAST, pmd.id
         )
@@ -757,8 +760,7 @@ async def sync_match_player_stats(pg_pool: asyncpg.Pool, hub_pool: asyncpg.Pool,
             COALESCE(pmd.distance_covered, 0) AS distance_covered,
             COALESCE(pmd.updated_at, ms.updated_at, ms.datetime) AS source_updated_at
         FROM player_match_data pmd
-        JOIN match_stats ms
-          ON {PLAYER_MATCH_JOIN_SQL}
+        {PLAYER_MATCH_JOIN_SQL}
         LEFT JOIN lineup_side
           ON lineup_side.match_stats_id = ms.id
          AND lineup_side.steam_id = pmd.steam_id::text
@@ -1299,6 +1301,10 @@ async def sync_tournaments(pg_pool: asyncpg.Pool, hub_pool: asyncpg.Pool, *, for
     ]
 
 
+async def _refresh_materialized_view(hub_pool: asyncpg.Pool, name: str) -> None:
+    await hub_pool.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {_hub_relation(name)}")
+
+
 async def sync_all(pg_pool: asyncpg.Pool, hub_pool: asyncpg.Pool, *, force_full: bool = False) -> list[SyncResult]:
     results: list[SyncResult] = []
     try:
@@ -1321,6 +1327,13 @@ async def sync_all(pg_pool: asyncpg.Pool, hub_pool: asyncpg.Pool, *, force_full:
                 source_updated_at=result.max_source_updated_at,
             )
 
+        changed_tables = {r.table for r in results if r.rows}
+        if force_full or changed_tables & {"hub_teams", "hub_matches"}:
+            await _refresh_materialized_view(hub_pool, "mv_hub_match_overview")
+        if force_full or changed_tables & {"hub_matches", "hub_match_player_stats"}:
+            await _refresh_materialized_view(hub_pool, "mv_hub_player_current_team")
+            await _refresh_materialized_view(hub_pool, "mv_hub_player_primary_position")
+
         for result in await sync_tournaments(pg_pool, hub_pool, force_full=force_full):
             results.append(result)
             await _mark_sync_state(
@@ -0,0 +1,15 @@
+CREATE MATERIALIZED VIEW IF NOT EXISTS __HUB_SCHEMA__.mv_hub_match_overview AS
+SELECT *
+FROM __HUB_SCHEMA__.v_hub_match_overview;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_hub_match_overview_id
+ON __HUB_SCHEMA__.mv_hub_match_overview (match_stats_id);
+
+CREATE INDEX IF NOT EXISTS idx_mv_hub_match_overview_datetime
+ON __HUB_SCHEMA__.mv_hub_match_overview (match_datetime DESC);
+
+CREATE INDEX IF NOT EXISTS idx_mv_hub_match_overview_home_datetime
+ON __HUB_SCHEMA__.mv_hub_match_overview (home_guild_id, match_datetime DESC);
+
+CREATE INDEX IF NOT EXISTS idx_mv_hub_match_overview_away_datetime
+ON __HUB_SCHEMA__.mv_hub_match_overview (away_guild_id, match_datetime DESC);
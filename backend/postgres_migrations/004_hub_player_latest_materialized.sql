@@ -0,0 +1,69 @@
+CREATE MATERIALIZED VIEW IF NOT EXISTS __HUB_SCHEMA__.mv_hub_player_current_team AS
+SELECT
+    latest.steam_id,
+    latest.resolved_team_guild_id AS team_guild_id,
+    latest.resolved_team_name AS guild_team_name
+FROM (
+    SELECT
+        pmd.steam_id,
+        COALESCE(
+            NULLIF(pmd.team_guild_id, ''),
+            CASE
+                WHEN pmd.team_side = 'home' THEN m.home_guild_id
+                WHEN pmd.team_side = 'away' THEN m.away_guild_id
+                ELSE NULL
+            END
+        ) AS resolved_team_guild_id,
+        COALESCE(
+            NULLIF(pmd.guild_team_name, ''),
+            CASE
+                WHEN pmd.team_side = 'home' THEN m.home_team_name
+                WHEN pmd.team_side = 'away' THEN m.away_team_name
+                ELSE NULL
+            END
+        ) AS resolved_team_name,
+        ROW_NUMBER() OVER (
+            PARTITION BY pmd.steam_id
+            ORDER BY COALESCE(pmd.source_updated_at, m.source_updated_at, m.match_datetime) DESC, pmd.match_stats_id DESC
+        ) AS row_num
+    FROM __HUB_SCHEMA__.hub_match_player_stats pmd
+    LEFT JOIN __HUB_SCHEMA__.hub_matches m ON m.match_stats_id = pmd.match_stats_id
+    WHERE pmd.team_guild_id IS NOT NULL OR pmd.team_side IN ('home', 'away')
+) latest
+WHERE latest.row_num = 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_hub_player_current_team_steam
+ON __HUB_SCHEMA__.mv_hub_player_current_team (steam_id);
+
+CREATE INDEX IF NOT EXISTS idx_mv_hub_player_current_team_guild
+ON __HUB_SCHEMA__.mv_hub_player_current_team (team_guild_id);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS __HUB_SCHEMA__.mv_hub_player_primary_position AS
+SELECT
+    ranked.steam_id,
+    ranked.position_code AS primary_position
+FROM (
+    SELECT
+        aggregated.steam_id,
+        aggregated.position_code,
+        ROW_NUMBER() OVER (
+            PARTITION BY aggregated.steam_id
+            ORDER BY aggregated.appearances_at_position DESC, aggregated.last_used_at DESC, aggregated.position_code ASC
+        ) AS row_num
+    FROM (
+        SELECT
+            pmd.steam_id,
+            UPPER(TRIM(pmd.position_code)) AS position_code,
+            COUNT(*) AS appearances_at_position,
+            MAX(COALESCE(pmd.source_updated_at, m.source_updated_at, m.match_datetime)) AS last_used_at
+        FROM __HUB_SCHEMA__.hub_match_player_stats pmd
+        LEFT JOIN __HUB_SCHEMA__.hub_matches m ON m.match_stats_id = pmd.match_stats_id
+        WHERE pmd.position_code IS NOT NULL
+          AND TRIM(pmd.position_code) <> ''
+        GROUP BY pmd.steam_id, UPPER(TRIM(pmd.position_code))
+    ) aggregated
+) ranked
+WHERE ranked.row_num = 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_hub_player_primary_position_steam
+ON __HUB_SCHEMA__.mv_hub_player_primary_position (steam_id);
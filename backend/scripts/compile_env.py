@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+ROOT_DIR = BACKEND_DIR.parents[1]
+OUTPUT_PATH = BACKEND_DIR / "app" / "_env_compiled.py"
+
+
+def main() -> None:
+    env: dict[str, str] = {}
+    for env_path in (BACKEND_DIR / ".env", ROOT_DIR / ".env"):
+        if env_path.exists():
+            env.update({key: value for key, value in dotenv_values(env_path).items() if value is not None})
+
+    lines = ["# Generated by scripts/compile_env.py. Do not edit or commit.", "ENV = {"]
+    lines.extend(f"    {key!r}: {value!r}," for key, value in sorted(env.items()))
+    lines.append("}")
+    OUTPUT_PATH.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    print(f"Wrote {len(env)} variables to {OUTPUT_PATH.relative_to(BACKEND_DIR)}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import orjson
+import pytest
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+pytest.importorskip("asyncpg")
+
+from app.db import JS_MAX_SAFE_INTEGER, dumps_public  # noqa: E402
+
+
+def test_dumps_public_stringifies_64_bit_discord_ids():
+    payload = {
+        "discord_id": 284786573216350208,
+        "linked_ids": [76561198012345678, 42],
+        "rating": Decimal("7.25"),
+    }
+
+    assert orjson.loads(dumps_public(payload)) == {
+        "discord_id": "284786573216350208",
+        "linked_ids": ["76561198012345678", 42],
+        "rating": 7.25,
+    }
+
+
+def test_dumps_public_keeps_safe_integers_numeric():
+    payload = {"low": -JS_MAX_SAFE_INTEGER, "high": JS_MAX_SAFE_INTEGER, "flag": True}
+
+    assert orjson.loads(dumps_public(payload)) == payload
@@ -1557,10 +1557,9 @@ function mapEvent(raw, namesByPlayer, matchSummary = null, lineupSideByPlayer =
 }
 
 function enrichTeams(teams, matches) {
+  const matchesByTeamId = groupMatchesByTeamId(matches)
   const enriched = teams.map((team) => {
-    const teamMatches = matches
-      .filter((match) => match.homeTeamId === team.id || match.awayTeamId === team.id)
-      .sort(compareMatchDates)
+    const teamMatches = matchesByTeamId.get(team.id) ?? []
 
     return {
       ...team,
@@ -1579,6 +1578,27 @@ function enrichTeams(teams, matches) {
   }))
 }
 
+function groupMatchesByTeamId(matches) {
+  const matchesByTeamId = new Map()
+
+  matches
+    .slice()
+    .sort(compareMatchDates)
+    .forEach((match) => {
+      new Set([match.homeTeamId, match.awayTeamId]).forEach((teamId) => {
+        if (!teamId) return
+        const teamMatches = matchesByTeamId.get(teamId)
+        if (teamMatches) {
+          teamMatches.push(match)
+        } else {
+          matchesByTeamId.set(teamId, [match])
+        }
+      })
+    })
+
+  return matchesByTeamId
+}
+
 function enrichPlayers(players, teams) {
   const teamIds = new Set(teams.map((team) => team.id))
   return players.map((player) => ({
@@ -1936,37 +1956,50 @@ function buildTournamentStandingsGroups(rawTournament, fixtures) {
 
   return Object.entries(standingsByLeague)
     .sort(([leftKey], [rightKey]) => leftKey.localeCompare(rightKey, undefined, { numeric: true, sensitivity: 'base' }))
-    .map(([leagueKey, rows]) => ({
-      name: formatTournamentLeagueLabel(leagueKey),
-      leagueKey,
-      rows: rows
-        .slice()
-        .sort(compareTournamentStandingsRows)
-        .map((row) => ({
-          teamId: row.guild_id ? String(row.guild_id) : null,
-          teamName: row.team_name ?? 'Unknown Team',
-          played: toNumber(row.matches_played),
-          wins: toNumber(row.wins),
-          draws: toNumber(row.draws),
-          losses: toNumber(row.losses),
-          goalsFor: toNumber(row.goals_for),
-          goalsAgainst: toNumber(row.goals_against),
-          gd: toNumber(row.goal_diff),
-          points: toNumber(row.points),
-          form: buildTournamentForm(row.guild_id ? String(row.guild_id) : null, fixturesByLeague[leagueKey] ?? []),
-        })),
-    }))
+    .map(([leagueKey, rows]) => {
+      const formsByTeamId = buildTournamentForms(fixturesByLeague[leagueKey] ?? [])
+
+      return {
+        name: formatTournamentLeagueLabel(leagueKey),
+        leagueKey,
+        rows: rows
+          .slice()
+          .sort(compareTournamentStandingsRows)
+          .map((row) => ({
+            teamId: row.guild_id ? String(row.guild_id) : null,
+            teamName: row.team_name ?? 'Unknown Team',
+            played: toNumber(row.matches_played),
+            wins: toNumber(row.wins),
+            draws: toNumber(row.draws),
+            losses: toNumber(row.losses),
+            goalsFor: toNumber(row.goals_for),
+            goalsAgainst: toNumber(row.goals_against),
+            gd: toNumber(row.goal_diff),
+            points: toNumber(row.points),
+            form: row.guild_id ? formsByTeamId.get(String(row.guild_id)) ?? [] : [],
+          })),
+      }
+    })
 }
 
-function buildTournamentForm(teamId, fixtures) {
-  if (!teamId) return []
+function buildTournamentForms(fixtures) {
+  const formsByTeamId = new Map()
 
-  return fixtures
+  fixtures
     .filter((fixture) => fixture.status === 'Final')
-    .filter((fixture) => fixture.homeTeamId === teamId || fixture.awayTeamId === teamId)
     .sort(compareMatchDates)
-    .slice(0, 5)
-    .map((fixture) => resultForTeam(teamId, fixture))
+    .forEach((fixture) => {
+      new Set([fixture.homeTeamId, fixture.awayTeamId]).forEach((teamId) => {
+        if (!teamId) return
+        const form = formsByTeamId.get(teamId) ?? []
+        if (form.length < 5) {
+          form.push(resultForTeam(teamId, fixture))
+          formsByTeamId.set(teamId, form)
+        }
+      })
+    })
+
+  return formsByTeamId
 }
 
 function mapTournamentFixture(rawFixture, tournament) {